@@ -10,20 +10,40 @@ Usage:
 """
 
 import argparse
+import collections
 import datetime
+import errno
+import functools
 import os
-import platform
+import re
 import shutil
+import stat
 import subprocess
 import sys
+import time
+from enum import IntEnum
 from pathlib import Path
 
+# Modules used only by the build/install steps (concurrent.futures, hashlib,
+# mmap, json) are imported where they are used, so --help and --list skip them.
+
 # ── constants ──────────────────────────────────────────────────────────────────
 REQUIRED_GO_MAJOR = 1
 REQUIRED_GO_MINOR = 24
+_GO_VER_RE = re.compile(r"(?:go)?((\d+)\.(\d+)\S*)")  # "go1.24.0" or "1.24.0"
 REPO_ROOT = Path(__file__).resolve().parent
-IS_WINDOWS = platform.system() == "Windows"
-SYSTEM = platform.system()  # "Darwin", "Linux", "Windows"
+# -trimpath/-buildvcs=false keep builds reproducible and skip Go's own git probes.
+GO_BUILD_FLAGS = ("-trimpath", "-buildvcs=false")
+
+class OS(IntEnum):
+    MAC = 0
+    LINUX = 1
+    WINDOWS = 2
+    OTHER = 3
+
+# sys.platform is fixed at interpreter build time: no `platform` import, no uname.
+_OS = {"darwin": OS.MAC, "linux": OS.LINUX, "win32": OS.WINDOWS}.get(sys.platform, OS.OTHER)
+IS_WINDOWS = _OS == OS.WINDOWS
 
 # Each MCP entry: { src_dir, bin_name, cgo, description, extra_args }
 MCPS = {
@@ -49,26 +69,69 @@ _USE_COLOR = sys.stdout.isatty()
 def _c(code: str, text: str) -> str:
     return f"\033[{code}m{text}\033[0m" if _USE_COLOR else text
 
-def info(msg: str)  -> None: print(f"{_c('0;32', '==>')} {msg}")
-def warn(msg: str)  -> None: print(f"{_c('1;33', 'warn:')} {msg}")
-def error(msg: str) -> None: print(f"{_c('0;31', 'error:')} {msg}", file=sys.stderr)
+_INFO_PREFIX  = _c("0;32", "==>")
+_WARN_PREFIX  = _c("1;33", "warn:")
+_ERROR_PREFIX = _c("0;31", "error:")
+
+def info(msg: str)  -> None: print(_INFO_PREFIX, msg)
+def warn(msg: str)  -> None: print(_WARN_PREFIX, msg)
+def error(msg: str) -> None: sys.stdout.flush(); print(_ERROR_PREFIX, msg, file=sys.stderr)
 def die(msg: str)   -> None: error(msg); sys.exit(1)
 def header(msg: str)-> None: print(f"\n{_c('0;34', '─── ' + msg + ' ───')}")
 
 # ── subprocess helpers ─────────────────────────────────────────────────────────
-def run(*cmd: str, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
-    return subprocess.run(cmd, cwd=cwd, check=check, text=True, capture_output=True)
+def run(*cmd: str, cwd: Path | None = None, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    """Run cmd, streaming to the terminal unless capture=True (for short probes)."""
+    if not capture:
+        sys.stdout.flush()  # child writes straight to the fd; keep our lines first
+    return subprocess.run(cmd, cwd=cwd, check=check, text=True, capture_output=capture)
+
+@functools.lru_cache(maxsize=None)
+def _resolve(name: str) -> str | None:
+    """Return the absolute path of name on PATH, memoized so each tool is looked up once."""
+    return shutil.which(name)
+
+def run_streamed(*cmd: str, cwd: Path | None = None, env: dict[str, str] | None = None, keep: int = 40) -> None:
+    """Echo cmd's combined output live; on failure raise with only the last `keep` lines."""
+    tail: collections.deque[str] = collections.deque(maxlen=keep)
+    sys.stdout.flush()
+    with subprocess.Popen(
+        cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+    ) as p:
+        for line in p.stdout:
+            tail.append(line)
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    if p.returncode:
+        raise subprocess.CalledProcessError(p.returncode, cmd, output="".join(tail))
 
 def which(name: str) -> bool:
-    return shutil.which(name) is not None
+    return _resolve(name) is not None
 
 # ── Go version check ───────────────────────────────────────────────────────────
+@functools.lru_cache(1)
+def _go_version() -> tuple[int, int, str]:
+    """Return (major, minor, raw) for the Go toolchain; $GO_VERSION skips the probe.
+
+    CI often sets GO_VERSION to things like "stable" or "1.x"; anything that
+    doesn't parse falls back to asking `go version`.
+    """
+    m = _GO_VER_RE.search(os.environ.get("GO_VERSION", ""))
+    if m:
+        return int(m[2]), int(m[3]), m[1]
+    raw = run("go", "version", capture=True).stdout
+    m = _GO_VER_RE.search(raw)
+    if not m:
+        raise ValueError(f"Could not parse Go version from {raw.strip()!r}")
+    return int(m[2]), int(m[3]), m[1]
+
 def check_go() -> None:
     if not which("go"):
         die("Go is not installed. Download it from https://go.dev/dl/ and re-run.")
-    result = run("go", "version")
-    version_str = result.stdout.split()[2].lstrip("go")  # e.g. "1.24.0"
-    major, minor = int(version_str.split(".")[0]), int(version_str.split(".")[1])
+    try:
+        major, minor, version_str = _go_version()
+    except ValueError as e:
+        die(str(e))
     if major < REQUIRED_GO_MAJOR or (major == REQUIRED_GO_MAJOR and minor < REQUIRED_GO_MINOR):
         die(f"Go {REQUIRED_GO_MAJOR}.{REQUIRED_GO_MINOR}+ required, found {version_str}")
     info(f"Go {version_str} found")
@@ -79,71 +142,226 @@ def default_install_dir() -> Path:
     override = os.environ.get("INSTALL_DIR")
     if override:
         return Path(override)
-    if SYSTEM == "Darwin":
-        return Path("/usr/local/bin")
-    if SYSTEM == "Linux":
+    if _OS in (OS.MAC, OS.LINUX):
         return Path("/usr/local/bin")
     # Windows: %LOCALAPPDATA%\Programs
     local_app_data = os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))
     return Path(local_app_data) / "Programs" / "mcp"
 
 # ── Tesseract (markitdown optional dep) ───────────────────────────────────────
+_ALL_PMS = ("brew", "apt-get", "dnf", "yum", "pacman", "zypper", "choco", "scoop", "winget")
+_PM_BY_OS = {
+    OS.MAC: ("brew",),
+    OS.WINDOWS: ("choco", "scoop", "winget"),
+}
+# /etc/os-release ID / ID_LIKE tokens -> package managers to probe, in order.
+_LINUX_PMS = {
+    "debian": ("apt-get",), "ubuntu": ("apt-get",),
+    "fedora": ("dnf", "yum"), "rhel": ("dnf", "yum"), "centos": ("dnf", "yum"),
+    "arch": ("pacman",),
+    "suse": ("zypper",), "opensuse": ("zypper",),
+}
+
+def _linux_pm_candidates() -> tuple[str, ...]:
+    """Pick package managers from /etc/os-release; probe them all if unrecognised."""
+    fields = {}
+    try:
+        with open("/etc/os-release") as f:
+            for line in f:
+                key, sep, value = line.strip().partition("=")
+                if sep:
+                    fields[key] = value.strip('"\'')
+    except OSError:
+        return _ALL_PMS
+    for distro in (fields.get("ID", ""), *fields.get("ID_LIKE", "").split()):
+        if distro in _LINUX_PMS:
+            return _LINUX_PMS[distro]
+    return _ALL_PMS
+
+@functools.lru_cache(1)
 def detect_pkg_manager() -> str:
-    for pm in ("brew", "apt-get", "dnf", "yum", "pacman", "zypper", "choco"):
-        if which(pm):
-            return pm
-    return "unknown"
+    candidates = _linux_pm_candidates() if _OS == OS.LINUX else _PM_BY_OS.get(_OS, _ALL_PMS)
+    return next((pm for pm in candidates if which(pm)), "unknown")
+
+def _apt_lists_stale(max_age: float = 24 * 3600) -> bool:
+    """True when apt's package lists are missing or older than max_age seconds.
+
+    Only *_Packages* index files count: apt recreates `lock` on every run, so
+    after the usual `rm -rf /var/lib/apt/lists/*` it would look fresh.
+    """
+    try:
+        with os.scandir("/var/lib/apt/lists") as it:
+            newest = max(
+                (e.stat().st_mtime for e in it if "_Packages" in e.name and e.is_file()),
+                default=0.0,
+            )
+    except OSError:
+        return True
+    return time.time() - newest > max_age
+
+def _dpkg_installed(package: str) -> bool:
+    result = run("dpkg-query", "-W", "-f=${Status}", package, check=False, capture=True)
+    return result.returncode == 0 and result.stdout.endswith("install ok installed")
 
 def install_tesseract() -> None:
     pm = detect_pkg_manager()
+    exe = _resolve(pm) or pm  # absolute path spares execvp a second PATH walk
     info(f"Installing Tesseract using: {pm}")
     try:
         if pm == "brew":
-            subprocess.run(["brew", "install", "tesseract"], check=True)
+            run(exe, "install", "tesseract")
         elif pm == "apt-get":
-            subprocess.run(["sudo", "apt-get", "update", "-q"], check=True)
-            subprocess.run(["sudo", "apt-get", "install", "-y", "tesseract-ocr"], check=True)
+            if _dpkg_installed("tesseract-ocr"):
+                info("tesseract-ocr package already installed")
+                return
+            # `sudo env …` because sudo's env_reset would drop DEBIAN_FRONTEND.
+            apt = ("sudo", "env", "DEBIAN_FRONTEND=noninteractive", exe, "-qq",
+                   "-o", "Acquire::Languages=none", "-o", "Dpkg::Use-Pty=0")
+            if _apt_lists_stale():
+                run(*apt, "update")
+            run(*apt, "install", "-y", "--no-install-recommends", "tesseract-ocr")
         elif pm == "dnf":
-            subprocess.run(["sudo", "dnf", "install", "-y", "tesseract"], check=True)
+            run("sudo", exe, "install", "-y", "tesseract")
         elif pm == "yum":
-            subprocess.run(["sudo", "yum", "install", "-y", "tesseract"], check=True)
+            run("sudo", exe, "install", "-y", "tesseract")
         elif pm == "pacman":
-            subprocess.run(["sudo", "pacman", "-Sy", "--noconfirm", "tesseract", "tesseract-data-eng"], check=True)
+            run("sudo", exe, "-Sy", "--noconfirm", "tesseract", "tesseract-data-eng")
         elif pm == "zypper":
-            subprocess.run(["sudo", "zypper", "install", "-y", "tesseract-ocr"], check=True)
+            run("sudo", exe, "install", "-y", "tesseract-ocr")
         elif pm == "choco":
-            subprocess.run(["choco", "install", "-y", "tesseract"], check=True)
+            run(exe, "install", "-y", "tesseract")
+        elif pm == "scoop":
+            run(exe, "install", "tesseract")
+        elif pm == "winget":
+            run(exe, "install", "-e", "--id", "UB-Mannheim.TesseractOCR")
         else:
             warn("Could not detect a supported package manager.")
             warn("Install Tesseract manually: https://github.com/tesseract-ocr/tesseract#installing-tesseract")
     except subprocess.CalledProcessError as e:
         die(f"Failed to install Tesseract: {e}")
+    _resolve.cache_clear()  # PATH contents changed
 
+@functools.lru_cache(1)
 def tesseract_version() -> str:
-    result = run("tesseract", "--version", check=False)
+    override = os.environ.get("TESSERACT_VERSION")
+    if override:
+        return override
+    try:
+        result = run("tesseract", "--version", check=False, capture=True)
+    except FileNotFoundError:  # e.g. package present but its bin dir not on PATH
+        return "unknown"
     output = result.stdout or result.stderr
     return output.splitlines()[0] if output else "unknown"
 
 def check_tesseract(with_ocr: bool) -> None:
+    present = which("tesseract")
     if with_ocr:
-        if which("tesseract"):
+        if present:
             info(f"Tesseract already installed: {tesseract_version()}")
         else:
             install_tesseract()
+            tesseract_version.cache_clear()
             info(f"Tesseract installed: {tesseract_version()}")
     else:
-        if which("tesseract"):
+        if present:
             info(f"Tesseract found: {tesseract_version()} — OCR enabled")
         else:
             warn("Tesseract not found — image OCR will be unavailable.")
             warn("Re-run with --with-ocr to install, or install manually.")
 
 # ── build + install ────────────────────────────────────────────────────────────
-def build_mcp(name: str, cfg: dict) -> Path:
+def _local_replace_dirs(src_dir: Path) -> list[Path]:
+    """Return module directories pulled in via `replace … => ../path` in go.mod."""
+    dirs = []
+    for line in (src_dir / "go.mod").read_text().splitlines():
+        _, sep, target = line.partition("=>")
+        target = target.strip()
+        if sep and target.startswith((".", "/")):
+            dirs.append((src_dir / target.split()[0]).resolve())
+    return dirs
+
+def _hash_file(h: "hashlib.blake2b", path: Path) -> None:
+    import mmap
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap refuses empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            h.update(m)
+
+def _toolchain_id() -> str:
+    """Identify the `go` binary on PATH without spawning it.
+
+    $GO_VERSION only stands in for the `go version` probe; the actual binary's
+    path, size and mtime still change the fingerprint when the toolchain does.
+    """
+    go = _resolve("go")
+    if not go:
+        return "go=?"
+    st = os.stat(go)
+    return f"go={go}:{st.st_size}:{st.st_mtime_ns}"
+
+# Environment variables that change what `go build` produces.
+_FINGERPRINT_ENV = (
+    "CGO_ENABLED", "GOOS", "GOARCH", "GOAMD64", "GOARM", "GOARM64", "GOEXPERIMENT", "GOFLAGS",
+    "GOTOOLCHAIN", "CC", "CXX", "CGO_CFLAGS", "CGO_CPPFLAGS", "CGO_CXXFLAGS", "CGO_LDFLAGS",
+)
+
+def source_fingerprint(src_dir: Path, env: dict[str, str], stamp_vars: str) -> str:
+    """Hash every input that affects the built binary (sources, modules, toolchain, env, -X vars)."""
+    import hashlib
+
+    h = hashlib.blake2b(digest_size=16)
+    for root in (src_dir, *_local_replace_dirs(src_dir)):
+        for path in sorted(root.rglob("*.go")):
+            h.update(os.path.relpath(path, src_dir).encode())
+            _hash_file(h, path)
+        for mod_file in ("go.mod", "go.sum"):
+            if (root / mod_file).exists():
+                _hash_file(h, root / mod_file)
+    h.update(f"{_go_version()[2]} {_toolchain_id()} {' '.join(GO_BUILD_FLAGS)} {stamp_vars}".encode())
+    for key in _FINGERPRINT_ENV:
+        h.update(f"\0{key}={env.get(key, '')}".encode())
+    h.update(_go_env_text().encode())  # `go env -w` settings (GOFLAGS, GOARCH, …)
+    return h.hexdigest()
+
+def _go_env_file() -> Path:
+    """Return the file `go env -w` writes to (mirrors os.UserConfigDir in Go)."""
+    override = os.environ.get("GOENV")
+    if override:
+        return Path(override)
+    config_dir = {
+        OS.MAC: lambda: Path.home() / "Library" / "Application Support",
+        OS.WINDOWS: lambda: Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming"),
+    }.get(_OS, lambda: Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"))()
+    return config_dir / "go" / "env"
+
+def _go_env_text() -> str:
+    try:
+        return _go_env_file().read_text()
+    except OSError:  # no file, or GOENV=off
+        return ""
+
+def _go_env_configured(key: str) -> bool:
+    """True when the user set key in the environment or persisted it with `go env -w`."""
+    if key in os.environ:
+        return True
+    return any(line.partition("=")[0].strip() == key for line in _go_env_text().splitlines())
+
+def _binary_id(path: Path) -> str:
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+def build_mcp(name: str, cfg: dict, tidy: bool = False) -> Path:
     src_dir: Path = cfg["src_dir"]
     bin_name: str = cfg["bin_name"]
     cgo_env = {"CGO_ENABLED": "1"} if cfg["cgo"] else {"CGO_ENABLED": "0"}
-    env = {**os.environ, **cgo_env}
+    # `go mod tidy` is a developer-time step; only run it when asked or when
+    # there is no go.sum yet. (`go build` is already -mod=readonly by default.)
+    tidy = tidy or not (src_dir / "go.sum").exists()
+    go_env = {} if _go_env_configured("GOCACHE") else {"GOCACHE": str(REPO_ROOT / ".gocache")}
+    user_env = {**os.environ, **cgo_env}
+    env = {**go_env, **user_env}
 
     # Collect version stamp vars (best-effort; fall back to defaults if git unavailable).
     def _git(args: list[str], fallback: str) -> str:
@@ -155,6 +373,21 @@ def build_mcp(name: str, cfg: dict) -> Path:
 
     version    = _git(["describe", "--tags", "--always", "--dirty"], "dev")
     commit     = _git(["rev-parse", "--short", "HEAD"], "unknown")
+
+    # The fingerprint covers version/commit (but not the build time) so a new
+    # commit or a dirty tree rebuilds; our own go_env defaults are excluded so
+    # --tidy and plain runs share a stamp.
+    # The stamp also records the binary's size/mtime, so an unrelated `go build`
+    # in src/<mcp> (which writes the same path) is not mistaken for our output.
+    built = src_dir / bin_name
+    stamp = src_dir / (bin_name + ".stamp")
+    stamp_vars = f"{version} {commit}"
+    fingerprint = source_fingerprint(src_dir, user_env, stamp_vars)
+    if (not tidy and built.exists() and stamp.exists()
+            and stamp.read_text().split() == [fingerprint, _binary_id(built)]):
+        info(f"{bin_name} up to date, skipping build")
+        return built
+
     build_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
     ldflags = (
         f"-s -w"
@@ -165,69 +398,113 @@ def build_mcp(name: str, cfg: dict) -> Path:
 
     info(f"Building {bin_name} ({version})...")
     try:
-        subprocess.run(
-            ["go", "mod", "tidy", "-e"],
-            cwd=src_dir, env=env, check=True, capture_output=True, text=True,
-        )
-        subprocess.run(
-            ["go", "build", f"-ldflags={ldflags}", f"-o={bin_name}", "."],
-            cwd=src_dir, env=env, check=True, capture_output=True, text=True,
+        if tidy:
+            run_streamed("go", "mod", "tidy", "-e", cwd=src_dir, env=env)
+        run_streamed(
+            "go", "build", *GO_BUILD_FLAGS, f"-ldflags={ldflags}", f"-o={bin_name}", ".",
+            cwd=src_dir, env=env,
         )
     except subprocess.CalledProcessError as e:
-        stderr = e.stderr or ""
-        die(f"Build failed for {name}:\n{stderr.strip()}")
+        die(f"Build failed for {name}:\n{(e.output or '').strip()}")
 
-    built = src_dir / bin_name
+    if tidy:
+        fingerprint = source_fingerprint(src_dir, user_env, stamp_vars)  # tidy may rewrite go.mod/go.sum
+    stamp.write_text(f"{fingerprint} {_binary_id(built)}\n")
     info(f"Built: {built}")
     return built
 
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst in kernel space with copy_file_range where the OS has it."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                os.fchmod(fdst.fileno(), 0o755)
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while n := os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    copied += n
+            # Some filesystems return 0 rather than an errno when unsupported;
+            # only trust the fast path if it moved every byte.
+            if copied == size:
+                return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    shutil.copy2(src, dst)
+
+def _ensure_dir(p: Path) -> None:
+    """Create p if missing; a single stat() when it already exists (the usual case)."""
+    try:
+        st = os.stat(p)
+    except FileNotFoundError:
+        os.makedirs(p, exist_ok=True)
+        return
+    if not stat.S_ISDIR(st.st_mode):
+        raise NotADirectoryError(p)
+
 def install_binary(bin_path: Path, install_dir: Path) -> Path:
-    install_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(install_dir)
     dest = install_dir / bin_path.name
-    shutil.copy2(bin_path, dest)
-    if not IS_WINDOWS:
-        dest.chmod(0o755)
+    if dest.exists() and os.path.samefile(bin_path, dest):
+        info(f"Installed: {dest}")  # --prefix is the build directory itself
+        return dest
+    # Stage a private copy next to dest (copy_file_range reflinks where the
+    # filesystem supports it) and rename it into place so the swap is atomic.
+    # No hardlink: the installed binary must not share an inode with the tree.
+    tmp = dest.with_name(dest.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        _fast_copy(bin_path, tmp)
+        if not IS_WINDOWS:
+            tmp.chmod(0o755)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
     info(f"Installed: {dest}")
     return dest
 
+@functools.lru_cache(maxsize=None)
+def _resolved_path_dirs(path_env: str) -> frozenset[str]:
+    """Resolve each PATH entry once so ~/.local/bin and /home/u/.local/bin match."""
+    return frozenset(
+        os.path.realpath(os.path.expanduser(d)) for d in path_env.split(os.pathsep) if d
+    )
+
 def check_path(install_dir: Path) -> None:
-    path_dirs = os.environ.get("PATH", "").split(os.pathsep)
-    if str(install_dir) not in path_dirs:
+    path_dirs = _resolved_path_dirs(os.environ.get("PATH", ""))
+    if os.path.realpath(install_dir.expanduser()) not in path_dirs:
         warn(f"{install_dir} is not on your PATH.")
         if IS_WINDOWS:
             warn(f'Add it: setx PATH "%PATH%;{install_dir}"')
         else:
             warn(f'Add to your shell profile: export PATH="{install_dir}:$PATH"')
 
+# Claude Desktop config location per OS; unknown systems fall back to the Windows layout.
+_CONFIG_PATHS = {
+    OS.MAC: lambda: Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",
+    OS.LINUX: lambda: Path.home() / ".config" / "Claude" / "claude_desktop_config.json",
+    OS.WINDOWS: lambda: Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming")
+        / "Claude" / "claude_desktop_config.json",
+}
+
 def print_config(installed: dict[str, tuple[Path, list[str]]]) -> None:
     """Print combined MCP config snippet for all installed servers."""
     if not installed:
         return
+    import json
 
-    if SYSTEM == "Darwin":
-        desktop_cfg = Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json"
-    elif SYSTEM == "Linux":
-        desktop_cfg = Path.home() / ".config" / "Claude" / "claude_desktop_config.json"
-    else:
-        appdata = os.environ.get("APPDATA", str(Path.home() / "AppData" / "Roaming"))
-        desktop_cfg = Path(appdata) / "Claude" / "claude_desktop_config.json"
-
-    snippets = []
+    desktop_cfg = _CONFIG_PATHS.get(_OS, _CONFIG_PATHS[OS.WINDOWS])()
+    servers = {}
     for name, (bin_path, mcp_args) in installed.items():
-        args_part = ""
+        servers[name] = {"command": str(bin_path)}
         if mcp_args:
-            args_part = ',\n      "args": [' + ", ".join(f'"{a}"' for a in mcp_args) + "]"
-        snippets.append(
-            f'    "{name}": {{\n      "command": "{bin_path}"{args_part}\n    }}'
-        )
+            servers[name]["args"] = mcp_args
 
     print()
     print("────────────────────────────────────────────────")
     print("  Add to your MCP client configuration:")
     print("────────────────────────────────────────────────")
-    print('{\n  "mcpServers": {')
-    print(",\n".join(snippets))
-    print("  }\n}")
+    print(json.dumps({"mcpServers": servers}, indent=2))
     print()
     print(f"Claude Desktop config: {desktop_cfg}")
     print("Claude Code config:    .mcp.json in your project root")
@@ -243,7 +520,9 @@ def main() -> None:
         epilog=(
             "Available MCPs:\n"
             + "\n".join(f"  {n:12s}  {c['description']}" for n, c in MCPS.items())
-            + "\n\nEnvironment:\n  INSTALL_DIR   Override the install directory"
+            + "\n\nEnvironment:\n  INSTALL_DIR        Override the install directory"
+            + "\n  GO_VERSION         Skip the `go version` probe (e.g. 1.24.0)"
+            + "\n  TESSERACT_VERSION  Skip the `tesseract --version` probe"
         ),
     )
     parser.add_argument(
@@ -262,6 +541,11 @@ def main() -> None:
         action="store_true",
         help="Install Tesseract OCR engine (used by markitdown)",
     )
+    parser.add_argument(
+        "--tidy",
+        action="store_true",
+        help="Run `go mod tidy` before building (default: only when go.sum is missing)",
+    )
     parser.add_argument(
         "--prefix",
         metavar="DIR",
@@ -285,12 +569,26 @@ def main() -> None:
     else:
         die(f"Unknown MCP: {args.mcp!r}. Available: {', '.join(MCPS)}")
 
+    # Block-buffer stdout even on a TTY; progress is flushed once per step below.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    import concurrent.futures
+
+    # Warm the version caches concurrently; the checks below then report in
+    # order without waiting on each fork+exec in turn. Failures resurface there.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        ex.submit(_go_version)
+        if "markitdown" in selected and which("tesseract"):
+            ex.submit(tesseract_version)
+
     check_go()
 
     if "markitdown" in selected:
         check_tesseract(args.with_ocr)
+    sys.stdout.flush()
 
-    if SYSTEM == "Linux" and str(args.prefix).startswith("/usr"):
+    if _OS == OS.LINUX and str(args.prefix).startswith("/usr"):
         warn(f"Installing to {args.prefix} may require sudo on Linux.")
         warn("Use INSTALL_DIR=~/.local/bin python3 install.py to install without sudo.")
 
@@ -298,13 +596,15 @@ def main() -> None:
     for name in selected:
         cfg = MCPS[name]
         header(name)
-        bin_path = build_mcp(name, cfg)
+        bin_path = build_mcp(name, cfg, tidy=args.tidy)
         full_path = install_binary(bin_path, args.prefix)
         installed[name] = (full_path, cfg["mcp_args"])
+        sys.stdout.flush()
 
     check_path(args.prefix)
     print_config(installed)
     info("Done. Restart your MCP client to pick up the new server(s).")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":